@@ -24,6 +24,7 @@ CSRF_TRUSTED_ORIGINS = env_list("CSRF_TRUSTED_ORIGINS")
 
 GENAI_API_KEY = os.getenv("GENAI_API_KEY")
 GENAI_MODEL = os.getenv("GENAI_MODEL", "gemini-2.5-flash")
+GENAI_TIMEOUT = int(os.getenv("GENAI_TIMEOUT", "30"))
 EMAIL_VERIFICATION_URL = os.getenv("EMAIL_VERIFICATION_URL", "http://127.0.0.1:8000")
 APP_BASE_URL = os.getenv("APP_BASE_URL", EMAIL_VERIFICATION_URL)
 
@@ -106,9 +107,13 @@ CHANNEL_LAYERS = {
 CELERY_BROKER_URL = REDIS_URL
 CELERY_RESULT_BACKEND = REDIS_URL
 CELERY_TASK_TRACK_STARTED = True
+CELERY_TASK_ALWAYS_EAGER = env_bool("CELERY_TASK_ALWAYS_EAGER", False)
 CELERY_TASK_TIME_LIMIT = int(os.getenv("CELERY_TASK_TIME_LIMIT", "120"))
 CELERY_TASK_DEFAULT_QUEUE = os.getenv("CELERY_TASK_DEFAULT_QUEUE", "default")
 
+REPORTS_CACHE_TIMEOUT = int(os.getenv("REPORTS_CACHE_TIMEOUT", "300"))
+REPORTS_QUERY_WORKERS = int(os.getenv("REPORTS_QUERY_WORKERS", "6"))
+
 AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"},
     {"NAME": "django.contrib.auth.password_validation.MinimumLengthValidator"},
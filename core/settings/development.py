@@ -2,6 +2,7 @@ from .base import *
 
 DEBUG = env_bool("DEBUG", True)
 ALLOWED_HOSTS = env_list("ALLOWED_HOSTS", "127.0.0.1,localhost")
+CELERY_TASK_ALWAYS_EAGER = env_bool("CELERY_TASK_ALWAYS_EAGER", True)
 
 if not env_bool("USE_REDIS_CHANNELS", False):
     CHANNEL_LAYERS = {
@@ -35,6 +35,9 @@ class ProblemConsumer(AsyncJsonWebsocketConsumer):
             }
         )
 
+    async def thread_updated(self, event):
+        await self.send_json({"type": "thread.updated"})
+
     async def presence_updated(self, event):
         await self.send_json(
             {
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.8 on 2026-10-14 07:02
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_vote_counts(apps, schema_editor):
+    Solution = apps.get_model("main", "Solution")
+    Vote = apps.get_model("main", "Vote")
+
+    def vote_total(vote_type):
+        counts = (
+            Vote.objects.filter(solution=OuterRef("pk"), type=vote_type)
+            .order_by()
+            .values("solution")
+            .annotate(count=Count("*"))
+            .values("count")
+        )
+        return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+    Solution.objects.update(upvote_count=vote_total("up"), downvote_count=vote_total("down"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='solution',
+            name='downvote_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='solution',
+            name='upvote_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_vote_counts, migrations.RunPython.noop),
+    ]
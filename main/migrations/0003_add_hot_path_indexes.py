@@ -0,0 +1,37 @@
+# Generated by Django 5.2.8 on 2026-10-14 07:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0002_solution_vote_counts'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='problem',
+            index=models.Index(fields=['-created_at'], name='problem_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='problem',
+            index=models.Index(fields=['topic'], name='problem_topic_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='solution',
+            index=models.Index(fields=['problem', '-created_at'], name='solution_problem_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vote',
+            index=models.Index(fields=['solution', 'type'], name='vote_solution_type_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='vote',
+            constraint=models.UniqueConstraint(fields=('user', 'solution'), name='uniq_vote'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='vote',
+            unique_together=set(),
+        ),
+    ]
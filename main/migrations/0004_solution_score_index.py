@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-14 07:12
+
+import django.db.models.expressions
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0003_add_hot_path_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='solution',
+            index=models.Index(models.OrderBy(django.db.models.expressions.CombinedExpression(models.F('upvote_count'), '-', models.F('downvote_count')), descending=True), models.OrderBy(models.F('created_at'), descending=True), name='solution_score_idx'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.8 on 2026-10-14 07:13
+
+from django.db import migrations, models
+
+
+def delete_invalid_votes(apps, schema_editor):
+    Vote = apps.get_model("main", "Vote")
+    Vote.objects.exclude(type__in=["up", "down"]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0004_solution_score_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_invalid_votes, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='vote',
+            name='type',
+            field=models.CharField(choices=[('up', 'Upvote'), ('down', 'Downvote')], max_length=4),
+        ),
+        migrations.AddConstraint(
+            model_name='vote',
+            constraint=models.CheckConstraint(condition=models.Q(('type__in', ['up', 'down'])), name='vote_type_valid'),
+        ),
+    ]
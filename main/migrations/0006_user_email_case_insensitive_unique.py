@@ -0,0 +1,38 @@
+# Generated by Django 5.2.8 on 2026-10-14 07:28
+
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import Lower
+
+
+def ensure_emails_unique_ignoring_case(apps, schema_editor):
+    CustomUser = apps.get_model("main", "CustomUser")
+    duplicates = list(
+        CustomUser.objects.annotate(email_lower=Lower("email"))
+        .values("email_lower")
+        .annotate(total=Count("id"))
+        .filter(total__gt=1)
+        .values_list("email_lower", flat=True)
+    )
+    if duplicates:
+        raise RuntimeError(
+            "Merge or rename accounts whose emails differ only by case before migrating: "
+            + ", ".join(duplicates)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('main', '0005_vote_type_constraint'),
+    ]
+
+    operations = [
+        migrations.RunPython(ensure_emails_unique_ignoring_case, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='customuser',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('email'), name='user_email_ci_unique'),
+        ),
+    ]
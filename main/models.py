@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.functions import Lower
 from django.contrib.auth.models import AbstractUser, BaseUserManager
 import uuid
 
@@ -41,6 +42,11 @@ class CustomUser(AbstractUser):
 
     objects = CustomUserManager()
 
+    class Meta(AbstractUser.Meta):
+        constraints = [
+            models.UniqueConstraint(Lower("email"), name="user_email_ci_unique"),
+        ]
+
 
 class Problem(models.Model):
     description = models.TextField()
@@ -57,6 +63,10 @@ class Problem(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["-created_at"], name="problem_created_idx"),
+            models.Index(fields=["topic"], name="problem_topic_idx"),
+        ]
         permissions = (
             ("view_reports_dashboard", "Can view reports dashboard"),
         )
@@ -111,10 +121,20 @@ class Solution(models.Model):
     )
 
     answer_type = models.CharField(max_length=20, choices=ANSWER_TYPES, default='direct')
+    upvote_count = models.PositiveIntegerField(default=0)
+    downvote_count = models.PositiveIntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["problem", "-created_at"], name="solution_problem_created_idx"),
+            models.Index(
+                (models.F("upvote_count") - models.F("downvote_count")).desc(),
+                models.F("created_at").desc(),
+                name="solution_score_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"Contribution #{self.pk} for problem #{self.problem_id}"
@@ -131,10 +151,22 @@ class Comment(models.Model):
 class Vote(models.Model):
     solution = models.ForeignKey(Solution, on_delete=models.CASCADE)
     user = models.ForeignKey(CustomUser, on_delete=models.CASCADE)
-    type = models.CharField(max_length=10, choices=(('up','Upvote'), ('down','Downvote')))
+
+    VOTE_TYPES = (
+        ('up', 'Upvote'),
+        ('down', 'Downvote'),
+    )
+
+    type = models.CharField(max_length=4, choices=VOTE_TYPES)
 
     class Meta:
-        unique_together = ('solution', 'user')
+        indexes = [
+            models.Index(fields=["solution", "type"], name="vote_solution_type_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=["user", "solution"], name="uniq_vote"),
+            models.CheckConstraint(condition=models.Q(type__in=["up", "down"]), name="vote_type_valid"),
+        ]
 
 
 class EmailVerification(models.Model):
@@ -1,19 +1,33 @@
-from .ai import AIServiceError, continue_problem_thread, create_problem_with_ai_response
-from .problems import get_problem_detail_context, list_problem_topics, list_recent_problems
-from .reports import build_reports_context
+from .ai import (
+    AIServiceError,
+    continue_problem_thread,
+    create_problem,
+    create_problem_with_ai_response,
+    generate_problem_ai_response,
+    stream_problem_thread,
+)
+from .problems import get_problem_detail_context, is_ai_reply_pending, list_problem_topics, list_recent_problems
+from .reports import build_reports_context, get_reports_context
 from .solutions import create_human_solution
 from .users import create_account, send_password_reset_email, send_verification_email
+from .votes import cast_vote
 
 __all__ = [
     "AIServiceError",
     "build_reports_context",
+    "cast_vote",
     "continue_problem_thread",
     "create_account",
     "create_human_solution",
+    "create_problem",
     "create_problem_with_ai_response",
+    "generate_problem_ai_response",
     "get_problem_detail_context",
+    "get_reports_context",
+    "is_ai_reply_pending",
     "list_problem_topics",
     "list_recent_problems",
     "send_password_reset_email",
     "send_verification_email",
+    "stream_problem_thread",
 ]
@@ -1,5 +1,11 @@
+import json
 import logging
+from collections.abc import AsyncIterator
+from functools import lru_cache
 
+import httpx
+from asgiref.sync import async_to_sync, sync_to_async
+from channels.layers import get_channel_layer
 from django.conf import settings
 from django.db import transaction
 from google import genai
@@ -35,15 +41,47 @@ VALID_TOPICS = {
     "Uncategorized",
 }
 
+TOPIC_AND_REPLY_PROMPT = (
+    "Answer the question above and classify it. Respond with a JSON object with two keys. "
+    "\"topic\" must be exactly one of: "
+    "Arrays, Strings, Math, Binary Search, Graphs, Dynamic Programming, "
+    "Greedy, Optimization, Complexity, Sorting, Hashmaps, Recursion, Trees, Uncategorized. "
+    "If the question is about performance, time/space complexity, or optimization, "
+    "use Optimization or Complexity. "
+    "\"solution\" is your full answer, formatted as described in the first message."
+)
+
+TOPIC_AND_REPLY_SCHEMA = types.Schema(
+    type=types.Type.OBJECT,
+    properties={
+        "topic": types.Schema(type=types.Type.STRING, enum=sorted(VALID_TOPICS)),
+        "solution": types.Schema(type=types.Type.STRING),
+    },
+    required=["topic", "solution"],
+    property_ordering=["topic", "solution"],
+)
+
 
 class AIServiceError(Exception):
     pass
 
 
+@lru_cache(maxsize=1)
+def _build_client(api_key: str) -> genai.Client:
+    limits = httpx.Limits(max_keepalive_connections=10)
+    # genai passes its own per-request timeout (milliseconds), which overrides the httpx client default.
+    http_options = types.HttpOptions(
+        timeout=settings.GENAI_TIMEOUT * 1000,
+        httpx_client=httpx.Client(http2=True, timeout=settings.GENAI_TIMEOUT, limits=limits),
+        httpx_async_client=httpx.AsyncClient(http2=True, timeout=settings.GENAI_TIMEOUT, limits=limits),
+    )
+    return genai.Client(api_key=api_key, http_options=http_options)
+
+
 def _get_client() -> genai.Client:
     if not settings.GENAI_API_KEY:
         raise AIServiceError("Google GenAI API key is missing.")
-    return genai.Client(api_key=settings.GENAI_API_KEY)
+    return _build_client(settings.GENAI_API_KEY)
 
 
 def _build_history(thread: Thread) -> list[dict[str, str]]:
@@ -53,25 +91,8 @@ def _build_history(thread: Thread) -> list[dict[str, str]]:
     return history
 
 
-def _generate_topic(description: str) -> str:
-    client = _get_client()
-    completion = client.models.generate_content(
-        model=settings.GENAI_MODEL,
-        contents=(
-            "Classify coding problems into exactly one topic from this list: "
-            "Arrays, Strings, Math, Binary Search, Graphs, Dynamic Programming, "
-            "Greedy, Optimization, Complexity, Sorting, Hashmaps, Recursion, Trees, Uncategorized. "
-            "If the question is about performance, time/space complexity, or optimization, "
-            "return Optimization or Complexity. "
-            "Return only the topic name.\n\n"
-            f"{description}"
-        ),
-        config=types.GenerateContentConfig(
-            temperature=0,
-            max_output_tokens=32,
-        ),
-    )
-    topic = (completion.text or "Uncategorized").strip()
+def _normalize_topic(topic: str, description: str) -> str:
+    topic = (topic or "").strip()
     if topic in VALID_TOPICS:
         return topic
 
@@ -107,8 +128,7 @@ def _generate_topic(description: str) -> str:
     return "Uncategorized"
 
 
-def _generate_assistant_reply(thread: Thread) -> str:
-    client = _get_client()
+def _build_contents(thread: Thread) -> list[types.Content]:
     contents = []
     for item in _build_history(thread):
         role = item["role"]
@@ -120,20 +140,69 @@ def _generate_assistant_reply(thread: Thread) -> str:
                 parts=[types.Part(text=item["content"])],
             )
         )
+    return contents
+
+
+def _generate_topic_and_reply(thread: Thread, description: str) -> tuple[str, str]:
+    client = _get_client()
+    contents = _build_contents(thread)
+    contents.append(
+        types.Content(
+            role="user",
+            parts=[types.Part(text=TOPIC_AND_REPLY_PROMPT)],
+        )
+    )
 
     completion = client.models.generate_content(
         model=settings.GENAI_MODEL,
         contents=contents,
         config=types.GenerateContentConfig(
             temperature=0.4,
-            max_output_tokens=1400,
+            max_output_tokens=1500,
+            response_mime_type="application/json",
+            response_schema=TOPIC_AND_REPLY_SCHEMA,
         ),
     )
+    try:
+        payload = json.loads(completion.text or "")
+    except json.JSONDecodeError:
+        payload = None
+    if not isinstance(payload, dict):
+        payload = {}
+
+    topic = _normalize_topic(str(payload.get("topic") or ""), description)
+    solution = str(payload.get("solution") or "").strip()
+    if not solution or _was_truncated(completion):
+        # A cut-off or malformed structured answer is unusable JSON; ask again for plain prose.
+        logger.warning("Google GenAI structured reply was unusable; regenerating as plain text")
+        solution = _generate_assistant_reply(thread)
+    return topic, solution
+
+
+def _was_truncated(completion) -> bool:
+    candidates = completion.candidates or []
+    return bool(candidates) and candidates[0].finish_reason == types.FinishReason.MAX_TOKENS
+
+
+def _reply_config() -> types.GenerateContentConfig:
+    return types.GenerateContentConfig(
+        temperature=0.4,
+        max_output_tokens=1400,
+    )
+
+
+def _generate_assistant_reply(thread: Thread) -> str:
+    client = _get_client()
+    completion = client.models.generate_content(
+        model=settings.GENAI_MODEL,
+        contents=_build_contents(thread),
+        config=_reply_config(),
+    )
     return (completion.text or "").strip()
 
 
 @transaction.atomic
-def create_problem_with_ai_response(*, user, description: str) -> Problem:
+def create_problem(*, user, description: str) -> Problem:
     cleaned_description = description.strip()
     problem = Problem.objects.create(
         user=user,
@@ -150,53 +219,113 @@ def create_problem_with_ai_response(*, user, description: str) -> Problem:
         content=cleaned_description,
         author=user,
     )
+    return problem
 
+
+def _broadcast_thread_updated(problem: Problem):
+    channel_layer = get_channel_layer()
+    if channel_layer is None:
+        return
     try:
-        problem.topic = _generate_topic(cleaned_description)
-        assistant_reply = _generate_assistant_reply(thread)
+        async_to_sync(channel_layer.group_send)(
+            f"problem_{problem.id}",
+            {"type": "thread.updated"},
+        )
+    except Exception:
+        logger.exception("Live thread broadcast failed for problem %s", problem.id)
+
+
+def generate_problem_ai_response(*, problem: Problem) -> Message:
+    thread = problem.thread
+    try:
+        topic, assistant_reply = _generate_topic_and_reply(thread, problem.description)
     except Exception as exc:
         logger.exception("Google GenAI generation failed")
         assistant_reply = "AI failed to generate a response right now. Please try again."
-        if isinstance(exc, AIServiceError):
-            problem.topic = "Uncategorized"
-        else:
-            problem.topic = "Unknown"
+        topic = "Uncategorized" if isinstance(exc, AIServiceError) else "Unknown"
 
-    problem.save(update_fields=["topic"])
-    Message.objects.create(
-        thread=thread,
-        role="assistant",
-        content=assistant_reply,
-    )
-    thread.save(update_fields=["updated_at"])
+    with transaction.atomic():
+        problem.topic = topic
+        problem.save(update_fields=["topic"])
+        assistant_message = Message.objects.create(
+            thread=thread,
+            role="assistant",
+            content=assistant_reply,
+        )
+        thread.save(update_fields=["updated_at"])
+
+    _broadcast_thread_updated(problem)
+    return assistant_message
+
+
+def create_problem_with_ai_response(*, user, description: str) -> Problem:
+    problem = create_problem(user=user, description=description)
+    generate_problem_ai_response(problem=problem)
     return problem
 
 
+FOLLOW_UP_FAILURE_REPLY = "AI failed to generate a follow-up response right now. Please try again."
+
+
 @transaction.atomic
-def continue_problem_thread(*, problem: Problem, user, content: str) -> Message:
+def _record_follow_up(*, problem: Problem, user, content: str) -> Thread:
     if not hasattr(problem, "thread"):
         thread = Thread.objects.create(problem=problem, title=problem.description[:255])
     else:
         thread = problem.thread
 
-    cleaned_content = content.strip()
     Message.objects.create(
         thread=thread,
         role="user",
-        content=cleaned_content,
+        content=content.strip(),
         author=user,
     )
+    return thread
 
-    try:
-        assistant_reply = _generate_assistant_reply(thread)
-    except Exception:
-        logger.exception("Google GenAI follow-up generation failed")
-        assistant_reply = "AI failed to generate a follow-up response right now. Please try again."
 
+def _save_assistant_message(thread: Thread, content: str) -> Message:
     assistant_message = Message.objects.create(
         thread=thread,
         role="assistant",
-        content=assistant_reply,
+        content=content,
     )
     thread.save(update_fields=["updated_at"])
     return assistant_message
+
+
+@transaction.atomic
+def continue_problem_thread(*, problem: Problem, user, content: str) -> Message:
+    thread = _record_follow_up(problem=problem, user=user, content=content)
+
+    try:
+        assistant_reply = _generate_assistant_reply(thread)
+    except Exception:
+        logger.exception("Google GenAI follow-up generation failed")
+        assistant_reply = FOLLOW_UP_FAILURE_REPLY
+
+    return _save_assistant_message(thread, assistant_reply)
+
+
+async def stream_problem_thread(*, problem: Problem, user, content: str) -> AsyncIterator[str]:
+    thread = await sync_to_async(_record_follow_up)(problem=problem, user=user, content=content)
+    contents = await sync_to_async(_build_contents)(thread)
+
+    parts = []
+    try:
+        client = _get_client()
+        stream = await client.aio.models.generate_content_stream(
+            model=settings.GENAI_MODEL,
+            contents=contents,
+            config=_reply_config(),
+        )
+        async for chunk in stream:
+            if chunk.text:
+                parts.append(chunk.text)
+                yield chunk.text
+    except Exception:
+        logger.exception("Google GenAI follow-up streaming failed")
+        if not parts:
+            parts.append(FOLLOW_UP_FAILURE_REPLY)
+            yield FOLLOW_UP_FAILURE_REPLY
+    finally:
+        await sync_to_async(_save_assistant_message)(thread, "".join(parts).strip() or FOLLOW_UP_FAILURE_REPLY)
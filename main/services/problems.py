@@ -1,12 +1,13 @@
-from django.db.models import Count, Prefetch, Q
+from django.db.models import Count, Prefetch
 
-from main.models import Comment, Problem, Solution
+from main.models import Comment, Message, Problem, Solution
 from .ai import VALID_TOPICS
 
 
 def list_recent_problems(*, query: str | None = None, status: str | None = None, topic: str | None = None):
     qs = (
         Problem.objects.select_related("user")
+        .only("id", "description", "topic", "created_at", "accepted_solution_id", "user__username")
         .annotate(
             solution_count=Count("solutions", distinct=True),
             ai_turn_count=Count("thread__messages", distinct=True),
@@ -35,10 +36,6 @@ def get_problem_detail_context(problem_id: int) -> dict:
             Prefetch(
                 "solutions",
                 queryset=Solution.objects.select_related("author")
-                .annotate(
-                    upvotes_count=Count("vote", filter=Q(vote__type="up")),
-                    downvotes_count=Count("vote", filter=Q(vote__type="down")),
-                )
                 .prefetch_related(Prefetch("comments", queryset=comment_queryset))
                 .order_by("-created_at"),
             ),
@@ -53,8 +50,16 @@ def get_problem_detail_context(problem_id: int) -> dict:
         "problem": problem,
         "human_contributions": list(problem.solutions.all()),
         "thread_messages": thread_messages,
+        "ai_reply_pending": bool(thread_messages) and not any(
+            message.role == "assistant" for message in thread_messages
+        ),
         "accepted_solution_id": problem.accepted_solution_id,
         "active_users": list(
             problem.presences.select_related("user").values_list("user__username", flat=True).distinct()
         ),
     }
+
+
+def is_ai_reply_pending(problem_id: int) -> bool:
+    thread_messages = Message.objects.filter(thread__problem_id=problem_id)
+    return thread_messages.exists() and not thread_messages.filter(role="assistant").exists()
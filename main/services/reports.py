@@ -1,34 +1,72 @@
-from django.db.models import Case, Count, F, IntegerField, Max, Q, Value, When
-from django.db.models.functions import TruncDate
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, connections
+from django.db.models import Case, Count, Exists, F, IntegerField, Max, OuterRef, Q, Subquery, Value, When
+from django.db.models.functions import Coalesce, Substr, TruncDate
 
 from main.models import Comment, CustomUser, Message, Problem, Solution, Thread, Vote
 
+REPORTS_CACHE_KEY = "reports_dashboard_context"
+REPORT_PREVIEW_LENGTH = 100
 
-def build_reports_context():
-    total_problems = Problem.objects.count()
-    total_threads = Thread.objects.count()
-    total_messages = Message.objects.count()
-    total_human_contributions = Solution.objects.count()
-    total_comments = Comment.objects.count()
-    total_votes = Vote.objects.count()
-    resolved_problems = Problem.objects.filter(accepted_solution__isnull=False).count()
-    community_touched_problems = Problem.objects.filter(solutions__isnull=False).distinct().count()
-    problems_with_ai = Problem.objects.filter(thread__messages__role="assistant").distinct().count()
-    resolution_rate = ((resolved_problems / total_problems) * 100) if total_problems else 0
-    community_response_rate = ((community_touched_problems / total_problems) * 100) if total_problems else 0
-    avg_messages_per_thread = (total_messages / total_threads) if total_threads else 0
 
-    assistant_message_count = Message.objects.filter(role="assistant").count()
-    owner_message_count = Message.objects.filter(role="user").count()
-    human_votes = Vote.objects.count()
-    human_avg_votes = human_votes / total_human_contributions if total_human_contributions else 0
+def _count_subquery(queryset, group_by: str):
+    counts = queryset.order_by().values(group_by).annotate(count=Count("*")).values("count")
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+
+def _preview(field: str):
+    return Substr(field, 1, REPORT_PREVIEW_LENGTH)
+
+
+def _split_topic_and_day_counts(rows) -> tuple[list[dict], list[dict]]:
+    per_topic = defaultdict(int)
+    per_day = defaultdict(int)
+    for row in rows:
+        per_topic[row["topic"]] += row["count"]
+        per_day[row["date"]] += row["count"]
+    problems_per_topic = [
+        {"topic": topic, "count": count}
+        for topic, count in sorted(per_topic.items(), key=lambda item: item[1], reverse=True)
+    ]
+    problems_daily = [{"date": date, "count": count} for date, count in sorted(per_day.items())]
+    return problems_per_topic, problems_daily
+
+
+def _evaluate(query):
+    return query() if callable(query) else list(query)
+
+
+def _evaluate_in_thread(query):
+    try:
+        return _evaluate(query)
+    finally:
+        connections.close_all()
+
 
-    problems_per_topic = Problem.objects.values("topic").annotate(count=Count("id")).order_by("-count")
-    problems_daily = (
+def _run_queries(queries: dict) -> dict:
+    workers = settings.REPORTS_QUERY_WORKERS
+    # Worker threads open their own connections and cannot see rows from an uncommitted transaction.
+    if workers <= 1 or connection.in_atomic_block:
+        return {name: _evaluate(query) for name, query in queries.items()}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {name: executor.submit(_evaluate_in_thread, query) for name, query in queries.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+
+def get_reports_context():
+    return cache.get_or_set(REPORTS_CACHE_KEY, build_reports_context, settings.REPORTS_CACHE_TIMEOUT)
+
+
+def build_reports_context():
+    problems_by_topic_and_day = (
         Problem.objects.annotate(date=TruncDate("created_at"))
-        .values("date")
+        .values("topic", "date")
         .annotate(count=Count("id"))
-        .order_by("date")
+        .order_by()
     )
 
     contribution_type_breakdown = (
@@ -37,12 +75,18 @@ def build_reports_context():
         .order_by("-count")
     )
 
+    user_contributions = _count_subquery(Solution.objects.filter(author=OuterRef("pk")), "author")
+    user_accepted_answers = _count_subquery(
+        Problem.objects.filter(accepted_solution__author=OuterRef("pk")), "accepted_solution__author"
+    )
+
     top_active_users = (
-        CustomUser.objects.annotate(
-            contributions_posted=Count("solution", distinct=True),
-            ai_threads_started=Count("problem", distinct=True),
-            comments_posted=Count("comment", distinct=True),
-            accepted_answers=Count("solution__accepted_for_problems", distinct=True),
+        CustomUser.objects.only("id", "username")
+        .annotate(
+            contributions_posted=user_contributions,
+            ai_threads_started=_count_subquery(Problem.objects.filter(user=OuterRef("pk")), "user"),
+            comments_posted=_count_subquery(Comment.objects.filter(author=OuterRef("pk")), "author"),
+            accepted_answers=user_accepted_answers,
         )
         .annotate(
             activity_score=F("contributions_posted") + F("comments_posted") + F("accepted_answers") + F("ai_threads_started")
@@ -51,13 +95,11 @@ def build_reports_context():
     )
 
     top_human_contributions = (
-        Solution.objects.select_related("problem", "author")
-        .annotate(
-            upvotes=Count("vote", filter=Q(vote__type="up")),
-            downvotes=Count("vote", filter=Q(vote__type="down")),
-        )
+        Solution.objects.select_related("author")
+        .only("id", "created_at", "upvote_count", "downvote_count", "author__username")
         .annotate(
-            score=F("upvotes") - F("downvotes"),
+            problem_preview=_preview("problem__description"),
+            score=F("upvote_count") - F("downvote_count"),
             accepted_rank=Case(
                 When(accepted_for_problems__isnull=False, then=Value(1)),
                 default=Value(0),
@@ -68,9 +110,15 @@ def build_reports_context():
     )
 
     most_consulted_ai_threads = (
-        Problem.objects.annotate(
-            assistant_turns=Count("thread__messages", filter=Q(thread__messages__role="assistant"), distinct=True),
-            owner_turns=Count("thread__messages", filter=Q(thread__messages__role="user"), distinct=True),
+        Problem.objects.only("id", "created_at")
+        .annotate(
+            description_preview=_preview("description"),
+            assistant_turns=_count_subquery(
+                Message.objects.filter(thread__problem=OuterRef("pk"), role="assistant"), "thread__problem"
+            ),
+            owner_turns=_count_subquery(
+                Message.objects.filter(thread__problem=OuterRef("pk"), role="user"), "thread__problem"
+            ),
         )
         .filter(assistant_turns__gt=0)
         .annotate(total_ai_activity=F("assistant_turns") + F("owner_turns"))
@@ -78,33 +126,94 @@ def build_reports_context():
     )
 
     best_users = (
-        CustomUser.objects.annotate(
-            total_upvotes=Count("solution__vote", filter=Q(solution__vote__type="up")),
-            total_contributions=Count("solution", distinct=True),
-            accepted_answers=Count("solution__accepted_for_problems", distinct=True),
+        CustomUser.objects.only("id", "username")
+        .annotate(
+            total_upvotes=_count_subquery(
+                Vote.objects.filter(solution__author=OuterRef("pk"), type="up"), "solution__author"
+            ),
+            total_contributions=user_contributions,
+            accepted_answers=user_accepted_answers,
         )
         .order_by("-accepted_answers", "-total_upvotes", "username")[:10]
     )
 
     most_active_problems = (
-        Problem.objects.annotate(
-            contribution_count=Count("solutions", distinct=True),
-            comment_count=Count("solutions__comments", distinct=True),
-            ai_turn_count=Count("thread__messages", filter=Q(thread__messages__role="assistant"), distinct=True),
+        Problem.objects.only("id", "created_at")
+        .annotate(
+            description_preview=_preview("description"),
+            contribution_count=_count_subquery(Solution.objects.filter(problem=OuterRef("pk")), "problem"),
+            comment_count=_count_subquery(
+                Comment.objects.filter(solution__problem=OuterRef("pk")), "solution__problem"
+            ),
+            ai_turn_count=_count_subquery(
+                Message.objects.filter(thread__problem=OuterRef("pk"), role="assistant"), "thread__problem"
+            ),
         )
         .annotate(activity_score=F("contribution_count") + F("comment_count") + F("ai_turn_count"))
         .order_by("-activity_score", "-created_at")[:10]
     )
 
     busiest_threads = (
-        Thread.objects.select_related("problem")
+        Thread.objects.only("id")
         .annotate(
+            problem_preview=_preview("problem__description"),
             total_messages=Count("messages"),
             last_message_at=Max("messages__created_at"),
         )
         .order_by("-total_messages", "-last_message_at")[:10]
     )
 
+    results = _run_queries(
+        {
+            "problem_stats": lambda: Problem.objects.aggregate(
+                total=Count("id"),
+                resolved=Count("id", filter=Q(accepted_solution__isnull=False)),
+                community_touched=Count("id", filter=Exists(Solution.objects.filter(problem=OuterRef("pk")))),
+                with_ai=Count(
+                    "id",
+                    filter=Exists(Message.objects.filter(thread__problem=OuterRef("pk"), role="assistant")),
+                ),
+            ),
+            "message_stats": lambda: Message.objects.aggregate(
+                total=Count("id"),
+                assistant=Count("id", filter=Q(role="assistant")),
+                owner=Count("id", filter=Q(role="user")),
+            ),
+            "total_threads": Thread.objects.count,
+            "total_human_contributions": Solution.objects.count,
+            "total_comments": Comment.objects.count,
+            "total_votes": Vote.objects.count,
+            "problems_by_topic_and_day": problems_by_topic_and_day,
+            "contribution_type_breakdown": contribution_type_breakdown,
+            "top_active_users": top_active_users,
+            "top_human_contributions": top_human_contributions,
+            "most_consulted_ai_threads": most_consulted_ai_threads,
+            "best_users": best_users,
+            "most_active_problems": most_active_problems,
+            "busiest_threads": busiest_threads,
+        }
+    )
+
+    problems_per_topic, problems_daily = _split_topic_and_day_counts(results["problems_by_topic_and_day"])
+    problem_stats = results["problem_stats"]
+    message_stats = results["message_stats"]
+    total_problems = problem_stats["total"]
+    resolved_problems = problem_stats["resolved"]
+    community_touched_problems = problem_stats["community_touched"]
+    problems_with_ai = problem_stats["with_ai"]
+    total_threads = results["total_threads"]
+    total_messages = message_stats["total"]
+    total_human_contributions = results["total_human_contributions"]
+    total_comments = results["total_comments"]
+    total_votes = results["total_votes"]
+    resolution_rate = ((resolved_problems / total_problems) * 100) if total_problems else 0
+    community_response_rate = ((community_touched_problems / total_problems) * 100) if total_problems else 0
+    avg_messages_per_thread = (total_messages / total_threads) if total_threads else 0
+
+    assistant_message_count = message_stats["assistant"]
+    owner_message_count = message_stats["owner"]
+    human_avg_votes = total_votes / total_human_contributions if total_human_contributions else 0
+
     community_share = ((community_touched_problems / total_problems) * 100) if total_problems else 0
     ai_share = ((problems_with_ai / total_problems) * 100) if total_problems else 0
 
@@ -126,7 +235,7 @@ def build_reports_context():
             "avg_messages_per_thread": avg_messages_per_thread,
             "problems_per_topic": problems_per_topic,
             "problems_daily": problems_daily,
-            "top_active_users": top_active_users,
+            "top_active_users": results["top_active_users"],
         },
         "ai": {
             "assistant_message_count": assistant_message_count,
@@ -135,13 +244,13 @@ def build_reports_context():
             "community_share": community_share,
             "ai_share": ai_share,
             "human_avg_votes": human_avg_votes,
-            "contribution_type_breakdown": contribution_type_breakdown,
+            "contribution_type_breakdown": results["contribution_type_breakdown"],
         },
         "oversight": {
-            "top_human_contributions": top_human_contributions,
-            "most_consulted_ai_threads": most_consulted_ai_threads,
-            "best_users": best_users,
-            "most_active_problems": most_active_problems,
-            "busiest_threads": busiest_threads,
+            "top_human_contributions": results["top_human_contributions"],
+            "most_consulted_ai_threads": results["most_consulted_ai_threads"],
+            "best_users": results["best_users"],
+            "most_active_problems": results["most_active_problems"],
+            "busiest_threads": results["busiest_threads"],
         },
     }
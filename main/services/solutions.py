@@ -23,8 +23,6 @@ def create_human_solution(*, problem: Problem, author, content: str, request):
         .prefetch_related("comments__author")
         .get(id=solution.id)
     )
-    solution.upvotes_count = 0
-    solution.downvotes_count = 0
 
     def _render_card(user):
         return render_to_string(
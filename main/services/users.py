@@ -4,6 +4,7 @@ import uuid
 from django.conf import settings
 from django.contrib.auth.tokens import default_token_generator
 from django.core.mail import EmailMultiAlternatives
+from django.db import transaction
 from django.template.loader import render_to_string
 from django.utils.encoding import force_bytes
 from django.utils.http import urlsafe_base64_encode
@@ -96,13 +97,14 @@ def send_password_reset_email(*, user: CustomUser):
 
 
 def create_account(*, username: str, email: str, password: str):
-    user = CustomUser.objects.create_user(
-        username=username,
-        email=email.strip().lower(),
-        password=password,
-        is_active=False,
-        is_verified=False,
-    )
+    with transaction.atomic():
+        user = CustomUser.objects.create_user(
+            username=username,
+            email=email.strip().lower(),
+            password=password,
+            is_active=False,
+            is_verified=False,
+        )
     email_sent = True
     try:
         send_verification_email(user=user)
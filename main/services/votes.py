@@ -0,0 +1,36 @@
+from django.db import IntegrityError, transaction
+
+from main.models import Solution, Vote
+
+VOTE_COUNT_FIELDS = {
+    "up": "upvote_count",
+    "down": "downvote_count",
+}
+
+
+def cast_vote(*, user, solution_id: int, vote_type: str) -> tuple[str, dict[str, int]]:
+    try:
+        with transaction.atomic():
+            vote, created = Vote.objects.select_for_update().get_or_create(
+                user=user,
+                solution_id=solution_id,
+                defaults={"type": vote_type},
+            )
+            if created:
+                message = "Vote recorded"
+            elif vote.type == vote_type:
+                vote.delete()
+                message = "Vote removed"
+            else:
+                vote.type = vote_type
+                vote.save(update_fields=["type"])
+                message = "Vote recorded"
+    except IntegrityError as exc:
+        if Solution.objects.filter(pk=solution_id).exists():
+            raise
+        raise Solution.DoesNotExist(f"Solution {solution_id} does not exist") from exc
+
+    counts = Solution.objects.filter(pk=solution_id).values("upvote_count", "downvote_count").first()
+    if counts is None:
+        raise Solution.DoesNotExist(f"Solution {solution_id} does not exist")
+    return message, {"upvotes": counts["upvote_count"], "downvotes": counts["downvote_count"]}
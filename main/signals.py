@@ -0,0 +1,43 @@
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import Solution, Vote
+from .services.votes import VOTE_COUNT_FIELDS
+
+
+def _increment(solution_id, vote_type):
+    counter = VOTE_COUNT_FIELDS.get(vote_type)
+    if counter:
+        Solution.objects.filter(pk=solution_id).update(**{counter: F(counter) + 1})
+
+
+def _decrement(solution_id, vote_type):
+    counter = VOTE_COUNT_FIELDS.get(vote_type)
+    if counter:
+        Solution.objects.filter(pk=solution_id, **{f"{counter}__gt": 0}).update(**{counter: F(counter) - 1})
+
+
+@receiver(pre_save, sender=Vote)
+def remember_previous_vote(sender, instance, **kwargs):
+    instance._previous_vote = None
+    if instance.pk and not instance._state.adding:
+        instance._previous_vote = (
+            Vote.objects.filter(pk=instance.pk).values_list("solution_id", "type").first()
+        )
+
+
+@receiver(post_save, sender=Vote)
+def sync_solution_vote_counts(sender, instance, created, **kwargs):
+    previous = getattr(instance, "_previous_vote", None)
+    current = (instance.solution_id, instance.type)
+    if created or previous is None:
+        _increment(*current)
+    elif previous != current:
+        _decrement(*previous)
+        _increment(*current)
+
+
+@receiver(post_delete, sender=Vote)
+def decrement_solution_vote_count(sender, instance, **kwargs):
+    _decrement(instance.solution_id, instance.type)
@@ -7,11 +7,15 @@
     const humanSolutionsList = document.getElementById("human-solutions-list");
     const humanSolutionForm = root.querySelector("[data-human-solution-form]");
     const humanSolutionStatus = root.querySelector("[data-human-solution-status]");
+    const threadMessages = root.querySelector("[data-thread-messages]");
+    const aiChatForm = root.querySelector("[data-ai-chat-form]");
+    const aiChatStatus = root.querySelector("[data-ai-chat-status]");
     const emptyState = root.querySelector("[data-empty-human-solutions]");
     const modal = document.getElementById("solution-modal");
     const modalBody = document.getElementById("modal-solution-body");
     const modalClose = document.querySelector("[data-close-solution-modal]");
     const isOwner = root.dataset.isOwner === "true";
+    const aiPending = root.dataset.aiPending === "true";
     const activeUsersList = root.querySelector("[data-active-users-list]");
     const activeUserCount = root.querySelector("[data-active-user-count]");
     const humanCount = root.querySelector("[data-human-count]");
@@ -153,6 +157,10 @@
                         "X-Requested-With": "XMLHttpRequest",
                     },
                 });
+                if (response.status === 401) {
+                    window.location.href = "/login/";
+                    return;
+                }
                 if (!response.ok) {
                     return;
                 }
@@ -318,6 +326,91 @@
         });
     }
 
+    const appendThreadBubble = (role, text) => {
+        const bubble = document.createElement("div");
+        bubble.className =
+            role === "assistant"
+                ? "rounded-3xl border border-emerald-500/20 bg-emerald-500/10 p-4"
+                : "rounded-3xl border border-white/10 bg-slate-950/70 p-4";
+        const label = document.createElement("span");
+        label.className = `text-xs font-semibold uppercase tracking-[0.2em] ${role === "assistant" ? "text-emerald-300" : "text-slate-400"}`;
+        label.textContent = role === "assistant" ? "Assistant" : "User";
+        const body = document.createElement("p");
+        body.className = "mt-3 whitespace-pre-wrap break-words rounded-2xl bg-slate-950/60 p-4 text-sm leading-6 text-slate-200";
+        body.textContent = text;
+        bubble.append(label, body);
+        threadMessages.append(bubble);
+        bubble.scrollIntoView({ block: "end" });
+        return body;
+    };
+
+    const readEventStream = async (response, onText) => {
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = "";
+        while (true) {
+            const { value, done } = await reader.read();
+            if (done) {
+                return;
+            }
+            buffer += decoder.decode(value, { stream: true });
+            let boundary = buffer.indexOf("\n\n");
+            while (boundary !== -1) {
+                const rawEvent = buffer.slice(0, boundary);
+                buffer = buffer.slice(boundary + 2);
+                boundary = buffer.indexOf("\n\n");
+                if (rawEvent.startsWith("event: done")) {
+                    return;
+                }
+                const dataLine = rawEvent.split("\n").find((line) => line.startsWith("data: "));
+                if (dataLine) {
+                    onText(JSON.parse(dataLine.slice(6)).text || "");
+                }
+            }
+        }
+    };
+
+    if (aiChatForm && threadMessages && window.ReadableStream) {
+        aiChatForm.addEventListener("submit", async (event) => {
+            event.preventDefault();
+            const formData = new FormData(aiChatForm);
+            const submitButton = aiChatForm.querySelector("button[type='submit']");
+            submitButton.disabled = true;
+            if (aiChatStatus) {
+                aiChatStatus.textContent = "Assistant is replying...";
+            }
+
+            try {
+                const response = await fetch(root.dataset.aiStreamEndpoint, {
+                    method: "POST",
+                    headers: {
+                        "X-CSRFToken": getCookie("csrftoken"),
+                        "X-Requested-With": "XMLHttpRequest",
+                    },
+                    body: formData,
+                });
+                if (!response.ok) {
+                    const data = await response.json().catch(() => ({}));
+                    if (aiChatStatus) {
+                        aiChatStatus.textContent = data.error || "Could not reach the assistant.";
+                    }
+                    submitButton.disabled = false;
+                    return;
+                }
+
+                aiChatForm.reset();
+                appendThreadBubble("user", formData.get("content"));
+                const replyBody = appendThreadBubble("assistant", "");
+                await readEventStream(response, (text) => {
+                    replyBody.textContent += text;
+                });
+            } catch (error) {
+                console.error("AI stream failed", error);
+            }
+            window.location.reload();
+        });
+    }
+
     const protocol = window.location.protocol === "https:" ? "wss" : "ws";
     let socket = null;
     let reconnectAttempts = 0;
@@ -347,6 +440,12 @@
                 renderActiveUsers(data.active_users || []);
                 return;
             }
+            if (data.type === "thread.updated") {
+                if (aiPending) {
+                    window.location.reload();
+                }
+                return;
+            }
             if (data.type !== "solution.created") {
                 return;
             }
@@ -383,6 +482,8 @@
 
         socket.addEventListener("open", () => {
             reconnectAttempts = 0;
+            // The reply may have landed before this socket joined the group.
+            checkAiReplyStatus();
             if (liveStatus) {
                 liveStatus.dataset.liveState = "online";
                 liveStatus.classList.remove("border-amber-400/40", "bg-amber-400/10", "text-amber-200");
@@ -398,7 +499,53 @@
         });
     };
 
+    const AI_STATUS_POLL_INTERVAL = 4000;
+    const AI_STATUS_MAX_POLLS = 45;
+    let aiStatusPolls = 0;
+    let aiStatusTimer = null;
+
+    const checkAiReplyStatus = async () => {
+        if (!aiPending || !root.dataset.aiStatusEndpoint) {
+            return;
+        }
+        try {
+            const response = await fetch(root.dataset.aiStatusEndpoint, {
+                headers: { "X-Requested-With": "XMLHttpRequest" },
+            });
+            if (response.ok) {
+                const data = await response.json();
+                if (!data.pending) {
+                    window.location.reload();
+                    return;
+                }
+            }
+        } catch (error) {
+            // Keep polling; the next attempt or a socket event may still recover the page.
+        }
+        scheduleAiStatusPoll();
+    };
+
+    const scheduleAiStatusPoll = () => {
+        if (!aiPending || aiStatusTimer) {
+            return;
+        }
+        if (aiStatusPolls >= AI_STATUS_MAX_POLLS) {
+            const placeholder = root.querySelector("[data-ai-pending-placeholder] p");
+            if (placeholder) {
+                placeholder.classList.remove("animate-pulse");
+                placeholder.textContent = "The assistant is taking longer than expected. Refresh the page to check again.";
+            }
+            return;
+        }
+        aiStatusPolls += 1;
+        aiStatusTimer = setTimeout(() => {
+            aiStatusTimer = null;
+            checkAiReplyStatus();
+        }, AI_STATUS_POLL_INTERVAL);
+    };
+
     connectSocket();
+    scheduleAiStatusPoll();
 
     document.addEventListener("visibilitychange", () => {
         if (document.visibilityState === "visible") {
@@ -2,7 +2,13 @@ from celery import shared_task
 from django.contrib.auth import get_user_model
 
 from main.models import Problem
-from main.services.ai import continue_problem_thread
+from main.services.ai import continue_problem_thread, generate_problem_ai_response
+
+
+@shared_task
+def generate_initial_ai_reply(problem_id: int):
+    problem = Problem.objects.select_related("thread").get(id=problem_id)
+    generate_problem_ai_response(problem=problem)
 
 
 @shared_task
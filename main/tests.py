@@ -1,13 +1,25 @@
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
+
 from django.contrib.auth import get_user_model
 from django.core import mail
-from django.test import Client, TestCase, override_settings
+from django.core.cache import cache
+from django.db import IntegrityError
+from django.test import Client, TestCase, TransactionTestCase, override_settings
 from django.urls import reverse
 
-from main.models import EmailVerification, Message, Problem, Solution, Thread
-from main.services.ai import continue_problem_thread, create_problem_with_ai_response
+from main.models import Comment, EmailVerification, Message, Problem, Solution, Thread, Vote
+from main.services.ai import (
+    _build_client,
+    _get_client,
+    continue_problem_thread,
+    create_problem,
+    create_problem_with_ai_response,
+)
+from main.services.reports import REPORTS_CACHE_KEY, build_reports_context, get_reports_context
 from main.services.users import create_account, send_password_reset_email, send_verification_email
+from main.services.votes import cast_vote
 
 
 @override_settings(CHANNEL_LAYERS={"default": {"BACKEND": "channels.layers.InMemoryChannelLayer"}})
@@ -21,9 +33,11 @@ class AIConversationServiceTests(TestCase):
             is_active=True,
         )
 
-    @patch("main.services.ai._generate_assistant_reply", return_value="Use a dictionary to track seen values.")
-    @patch("main.services.ai._generate_topic", return_value="Hashmaps")
-    def test_problem_submission_creates_thread_messages_without_ai_solution_projection(self, mocked_topic, mocked_reply):
+    @patch(
+        "main.services.ai._generate_topic_and_reply",
+        return_value=("Hashmaps", "Use a dictionary to track seen values."),
+    )
+    def test_problem_submission_creates_thread_messages_without_ai_solution_projection(self, mocked_generate):
         problem = create_problem_with_ai_response(
             user=self.user,
             description="How do I solve two sum efficiently?",
@@ -34,6 +48,112 @@ class AIConversationServiceTests(TestCase):
         self.assertEqual(Message.objects.filter(thread=problem.thread).count(), 2)
         self.assertFalse(Solution.objects.filter(problem=problem).exists())
 
+    @patch("main.services.ai._get_client")
+    def test_problem_submission_uses_single_structured_generation_call(self, mocked_client):
+        generate_content = mocked_client.return_value.models.generate_content
+        generate_content.return_value = MagicMock(
+            text='{"topic": "Graphs", "solution": "Run a breadth-first search from the source."}'
+        )
+
+        problem = create_problem_with_ai_response(
+            user=self.user,
+            description="Shortest path in an unweighted graph?",
+        )
+
+        self.assertEqual(generate_content.call_count, 1)
+        self.assertEqual(problem.topic, "Graphs")
+        self.assertEqual(
+            problem.thread.messages.get(role="assistant").content,
+            "Run a breadth-first search from the source.",
+        )
+
+    @patch("main.services.ai._generate_assistant_reply", return_value="Sort the array first, then scan it once.")
+    @patch("main.services.ai._get_client")
+    def test_truncated_structured_reply_falls_back_to_plain_text(self, mocked_client, mocked_reply):
+        mocked_client.return_value.models.generate_content.return_value = MagicMock(
+            text='{"topic": "Arrays", "solution": "Start by sorting the arr'
+        )
+
+        problem = create_problem_with_ai_response(user=self.user, description="Find duplicates in an array")
+
+        self.assertEqual(problem.topic, "Arrays")
+        self.assertEqual(
+            problem.thread.messages.get(role="assistant").content,
+            "Sort the array first, then scan it once.",
+        )
+
+    @patch("main.services.ai._generate_assistant_reply", return_value="Walk the tree recursively.")
+    @patch("main.services.ai._get_client")
+    def test_non_object_structured_reply_uses_description_topic(self, mocked_client, mocked_reply):
+        mocked_client.return_value.models.generate_content.return_value = MagicMock(text='["x"]')
+
+        problem = create_problem_with_ai_response(user=self.user, description="How deep is my binary tree?")
+
+        self.assertEqual(problem.topic, "Trees")
+        self.assertEqual(problem.thread.messages.get(role="assistant").content, "Walk the tree recursively.")
+
+    @patch("main.views.generate_initial_ai_reply")
+    def test_submit_problem_queues_ai_reply_and_redirects(self, mocked_task):
+        self.client.login(email="owner@example.com", password="password123")
+
+        response = self.client.post(reverse("submit"), {"description": "Why is my recursion slow?"})
+
+        problem = Problem.objects.get(user=self.user)
+        self.assertRedirects(response, reverse("problem_detail", args=[problem.id]), fetch_redirect_response=False)
+        mocked_task.delay.assert_called_once_with(problem.id)
+        self.assertEqual(list(problem.thread.messages.values_list("role", flat=True)), ["user"])
+
+        detail = self.client.get(reverse("problem_detail", args=[problem.id]))
+        self.assertTrue(detail.context["ai_reply_pending"])
+
+    def test_ai_reply_status_reports_pending_until_assistant_replies(self):
+        problem = create_problem(user=self.user, description="Why is my recursion slow?")
+        status_url = reverse("ai_reply_status", args=[problem.id])
+
+        self.assertEqual(self.client.get(status_url).json(), {"pending": True})
+
+        Message.objects.create(thread=problem.thread, role="assistant", content="Memoize it.")
+        self.assertEqual(self.client.get(status_url).json(), {"pending": False})
+
+    @patch("main.services.ai._get_client")
+    async def test_streamed_follow_up_sends_chunks_and_persists_reply(self, mocked_client):
+        async def chunks():
+            for text in ("Use a ", "set."):
+                yield MagicMock(text=text)
+
+        mocked_client.return_value.aio.models.generate_content_stream = AsyncMock(return_value=chunks())
+        problem = await Problem.objects.acreate(user=self.user, description="Initial question", topic="Uncategorized")
+        await self.async_client.aforce_login(self.user)
+
+        response = await self.async_client.post(
+            reverse("stream_ai_message", args=[problem.id]), {"content": "Faster lookup?"}
+        )
+        body = b"".join([part async for part in response.streaming_content]).decode()
+
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        self.assertIn('data: {"text": "Use a "}', body)
+        self.assertTrue(body.endswith("event: done\ndata: {}\n\n"))
+        thread_messages = Message.objects.filter(thread__problem=problem).values_list("role", "content")
+        self.assertEqual(
+            [message async for message in thread_messages],
+            [("user", "Faster lookup?"), ("assistant", "Use a set.")],
+        )
+
+    @override_settings(GENAI_API_KEY="test-key")
+    def test_genai_client_is_reused_across_calls(self):
+        self.assertIs(_get_client(), _get_client())
+
+    @override_settings(GENAI_API_KEY="timeout-key", GENAI_TIMEOUT=12)
+    @patch("main.services.ai.genai.Client")
+    def test_genai_client_applies_configured_timeout(self, mocked_client):
+        self.addCleanup(_build_client.cache_clear)
+
+        _get_client()
+
+        http_options = mocked_client.call_args.kwargs["http_options"]
+        self.assertEqual(http_options.timeout, 12000)
+        self.assertIsInstance(http_options.httpx_async_client, httpx.AsyncClient)
+
     @patch("main.services.ai._generate_assistant_reply", return_value="Yes, a set works well for membership checks.")
     def test_follow_up_adds_new_messages_only(self, mocked_reply):
         problem = Problem.objects.create(user=self.user, description="Initial question", topic="Uncategorized")
@@ -87,6 +207,238 @@ class HumanContributionViewTests(TestCase):
         self.assertEqual(response.status_code, 201)
         self.assertTrue(Solution.objects.filter(problem=self.problem, author=self.helper).exists())
 
+    def test_add_comment_redirects_to_problem(self):
+        solution = Solution.objects.create(problem=self.problem, author=self.owner, content="Check the range bounds.")
+
+        with self.assertNumQueries(4):
+            response = self.client.post(reverse("add_comment", args=[solution.id]), {"content": "Good catch."})
+
+        self.assertRedirects(response, reverse("problem_detail", args=[self.problem.id]), fetch_redirect_response=False)
+        self.assertTrue(Comment.objects.filter(solution=solution, author=self.helper, content="Good catch.").exists())
+
+
+class VoteViewTests(TestCase):
+    def setUp(self):
+        user_model = get_user_model()
+        self.owner = user_model.objects.create_user(
+            email="asker@example.com",
+            username="asker",
+            password="password123",
+            is_verified=True,
+            is_active=True,
+        )
+        self.voter = user_model.objects.create_user(
+            email="voter@example.com",
+            username="voter",
+            password="password123",
+            is_verified=True,
+            is_active=True,
+        )
+        problem = Problem.objects.create(user=self.owner, description="Off by one in my loop", topic="Arrays")
+        self.solution = Solution.objects.create(problem=problem, author=self.owner, content="Use range(len(items)).")
+        self.client.login(email="voter@example.com", password="password123")
+
+    def test_vote_toggles_and_returns_counts(self):
+        url = reverse("vote_solution", args=[self.solution.id, "up"])
+
+        first = self.client.post(url).json()
+        second = self.client.post(url).json()
+
+        self.assertEqual((first["upvotes"], first["downvotes"]), (1, 0))
+        self.assertEqual(second["message"], "Vote removed")
+        self.assertEqual((second["upvotes"], second["downvotes"]), (0, 0))
+
+    def test_vote_switches_type(self):
+        self.client.post(reverse("vote_solution", args=[self.solution.id, "up"]))
+
+        data = self.client.post(reverse("vote_solution", args=[self.solution.id, "down"])).json()
+
+        self.assertEqual((data["upvotes"], data["downvotes"]), (0, 1))
+        self.solution.refresh_from_db()
+        self.assertEqual((self.solution.upvote_count, self.solution.downvote_count), (0, 1))
+
+    def test_saving_changed_vote_type_moves_cached_counts(self):
+        vote = Vote.objects.create(solution=self.solution, user=self.voter, type="up")
+
+        vote.type = "down"
+        vote.save()
+        vote.save()
+
+        self.solution.refresh_from_db()
+        self.assertEqual((self.solution.upvote_count, self.solution.downvote_count), (0, 1))
+
+    def test_deleting_voter_decrements_cached_counts(self):
+        self.client.post(reverse("vote_solution", args=[self.solution.id, "up"]))
+
+        self.voter.delete()
+
+        self.solution.refresh_from_db()
+        self.assertEqual(self.solution.upvote_count, 0)
+
+    @patch("main.services.votes.Vote.objects.select_for_update")
+    def test_integrity_error_on_existing_solution_is_not_reported_as_missing(self, mocked_select):
+        mocked_select.return_value.get_or_create.side_effect = IntegrityError("CHECK constraint failed")
+
+        with self.assertRaises(IntegrityError):
+            cast_vote(user=self.voter, solution_id=self.solution.id, vote_type="up")
+
+    def test_anonymous_vote_gets_json_401(self):
+        self.client.logout()
+
+        response = self.client.post(reverse("vote_solution", args=[self.solution.id, "up"]))
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json(), {"error": "Authentication required."})
+
+    def test_vote_rejects_unknown_type(self):
+        response = self.client.post(reverse("vote_solution", args=[self.solution.id, "sideways"]))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Vote.objects.exists())
+
+
+class ReportsContextTests(TestCase):
+    def setUp(self):
+        user_model = get_user_model()
+        self.owner = user_model.objects.create_user(
+            email="reporter@example.com",
+            username="reporter",
+            password="password123",
+            is_verified=True,
+            is_active=True,
+        )
+        self.helper = user_model.objects.create_user(
+            email="reporthelper@example.com",
+            username="reporthelper",
+            password="password123",
+            is_verified=True,
+            is_active=True,
+        )
+        answered = Problem.objects.create(user=self.owner, description="Answered", topic="Graphs")
+        Problem.objects.create(user=self.owner, description="Unanswered", topic="Arrays")
+        thread = Thread.objects.create(problem=answered, title="Answered")
+        Message.objects.create(thread=thread, role="user", content="Help", author=self.owner)
+        Message.objects.create(thread=thread, role="assistant", content="Sure")
+        solution = Solution.objects.create(problem=answered, author=self.helper, content="Use BFS.")
+        Solution.objects.create(problem=answered, author=self.helper, content="Or DFS.")
+        answered.accepted_solution = solution
+        answered.save(update_fields=["accepted_solution"])
+        Vote.objects.create(solution=solution, user=self.owner, type="up")
+
+    def test_overview_and_ai_counts(self):
+        context = build_reports_context()
+
+        self.assertEqual(context["overview"]["total_problems"], 2)
+        self.assertEqual(context["overview"]["resolved_problems"], 1)
+        self.assertEqual(context["overview"]["community_touched_problems"], 1)
+        self.assertEqual(context["overview"]["problems_with_ai"], 1)
+        self.assertEqual(context["engagement"]["total_messages"], 2)
+        self.assertEqual(context["ai"]["assistant_message_count"], 1)
+        self.assertEqual(context["ai"]["owner_message_count"], 1)
+        self.assertEqual(context["ai"]["human_avg_votes"], 0.5)
+        self.assertEqual(context["oversight"]["top_human_contributions"][0].score, 1)
+        self.assertEqual(
+            sorted((row["topic"], row["count"]) for row in context["engagement"]["problems_per_topic"]),
+            [("Arrays", 1), ("Graphs", 1)],
+        )
+        self.assertEqual(sum(row["count"] for row in context["engagement"]["problems_daily"]), 2)
+
+    def test_leaderboards_count_each_relation_independently(self):
+        solution = Solution.objects.get(content="Use BFS.")
+        Comment.objects.create(solution=solution, author=self.helper, content="Edge case: empty graph.")
+        Comment.objects.create(solution=solution, author=self.helper, content="Works for cycles too.")
+
+        context = build_reports_context()
+
+        helper_row = next(
+            user for user in context["engagement"]["top_active_users"] if user.username == "reporthelper"
+        )
+        self.assertEqual(helper_row.contributions_posted, 2)
+        self.assertEqual(helper_row.comments_posted, 2)
+        self.assertEqual(helper_row.accepted_answers, 1)
+        self.assertEqual(helper_row.activity_score, 5)
+        best = context["oversight"]["best_users"][0]
+        self.assertEqual((best.username, best.total_upvotes, best.total_contributions), ("reporthelper", 1, 2))
+        busiest_problem = context["oversight"]["most_active_problems"][0]
+        self.assertEqual(
+            (busiest_problem.contribution_count, busiest_problem.comment_count, busiest_problem.ai_turn_count),
+            (2, 2, 1),
+        )
+
+    def test_reports_context_is_cached_between_calls(self):
+        cache.delete(REPORTS_CACHE_KEY)
+        first = get_reports_context()
+
+        with self.assertNumQueries(0):
+            second = get_reports_context()
+
+        self.assertEqual(second["overview"], first["overview"])
+        self.assertEqual(
+            [user.username for user in second["engagement"]["top_active_users"]],
+            [user.username for user in first["engagement"]["top_active_users"]],
+        )
+        cache.delete(REPORTS_CACHE_KEY)
+
+    def test_dashboard_renders_for_staff(self):
+        cache.delete(REPORTS_CACHE_KEY)
+        staff = get_user_model().objects.create_superuser(email="staff@example.com", password="password123")
+        self.client.force_login(staff)
+
+        response = self.client.get(reverse("myadmin:reports_dashboard"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "reporthelper")
+        self.assertContains(response, "Answered")
+        cache.delete(REPORTS_CACHE_KEY)
+
+
+class ParallelReportsContextTests(TransactionTestCase):
+    @override_settings(REPORTS_QUERY_WORKERS=4)
+    def test_parallel_build_matches_sequential_build(self):
+        user = get_user_model().objects.create_user(
+            email="parallel@example.com",
+            username="parallel",
+            password="password123",
+            is_verified=True,
+            is_active=True,
+        )
+        problem = Problem.objects.create(user=user, description="Parallel question", topic="Sorting")
+        Solution.objects.create(problem=problem, author=user, content="Merge sort.")
+
+        parallel = build_reports_context()
+        with override_settings(REPORTS_QUERY_WORKERS=1):
+            sequential = build_reports_context()
+
+        self.assertEqual(parallel["overview"], sequential["overview"])
+        self.assertEqual(parallel["engagement"]["total_human_contributions"], 1)
+        self.assertEqual(
+            [item.pk for item in parallel["oversight"]["most_active_problems"]],
+            [item.pk for item in sequential["oversight"]["most_active_problems"]],
+        )
+
+
+class HomeViewTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            email="poster@example.com",
+            username="poster",
+            password="password123",
+            is_verified=True,
+            is_active=True,
+        )
+        Problem.objects.bulk_create(
+            Problem(user=self.user, description=f"Problem {index}", topic="Arrays") for index in range(30)
+        )
+
+    def test_home_paginates_problems(self):
+        first_page = self.client.get(reverse("home"))
+        second_page = self.client.get(reverse("home"), {"page": 2, "topic": "Arrays"})
+
+        self.assertEqual(len(first_page.context["problems"]), 25)
+        self.assertEqual(len(second_page.context["problems"]), 5)
+        self.assertContains(first_page, "30 active threads")
+        self.assertContains(second_page, "topic=Arrays&page=1")
+
 
 class UserOnboardingTests(TestCase):
     @override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
@@ -100,6 +452,40 @@ class UserOnboardingTests(TestCase):
         self.assertEqual(len(mail.outbox), 1)
         self.assertIn("verify-email", mail.outbox[0].body.lower())
 
+    def test_signup_with_taken_email_reports_duplicate(self):
+        get_user_model().objects.create_user(email="taken@example.com", username="taken", password="password123")
+
+        response = self.client.post(
+            reverse("signup"),
+            {
+                "username": "another",
+                "email": "taken@example.com",
+                "password": "password123",
+                "confirm_password": "password123",
+            },
+            follow=True,
+        )
+
+        self.assertContains(response, "already exists")
+        self.assertEqual(get_user_model().objects.filter(email="taken@example.com").count(), 1)
+
+    def test_signup_with_differently_cased_email_reports_duplicate(self):
+        get_user_model().objects.create_user(email="Taken@Example.com", username="taken", password="password123")
+
+        response = self.client.post(
+            reverse("signup"),
+            {
+                "username": "another",
+                "email": "taken@example.com",
+                "password": "password123",
+                "confirm_password": "password123",
+            },
+            follow=True,
+        )
+
+        self.assertContains(response, "already exists")
+        self.assertEqual(get_user_model().objects.filter(email__iexact="taken@example.com").count(), 1)
+
     def test_login_blocked_when_email_not_verified(self):
         user_model = get_user_model()
         user_model.objects.create_user(
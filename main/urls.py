@@ -13,6 +13,8 @@ urlpatterns = [
     path('', views.home, name='home'),
     path('problem/<int:problem_id>/', views.problem_detail, name='problem_detail'),
     path('problem/<int:problem_id>/chat/', views.add_ai_message, name='add_ai_message'),
+    path('problem/<int:problem_id>/chat/stream/', views.stream_ai_message, name='stream_ai_message'),
+    path('problem/<int:problem_id>/ai-status/', views.ai_reply_status, name='ai_reply_status'),
     path('problem/<int:problem_id>/add_solution/', views.add_human_solution, name='add_human_solution'),
     path('add_comment/<int:solution_id>/', views.add_comment, name='add_comment'),
     path('vote/<int:solution_id>/<str:vote_type>/', views.vote_solution, name='vote_solution'),
@@ -1,37 +1,58 @@
 import csv
+import json
 import logging
+from functools import wraps
 from io import BytesIO
 
 from django.contrib import messages
 from django.core.exceptions import PermissionDenied
+from django.core.paginator import Paginator
 from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.tokens import default_token_generator
 from django.contrib.auth.decorators import login_required
 from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib.auth import get_user_model
-from django.http import Http404, HttpResponse, JsonResponse
+from django.http import Http404, HttpResponse, JsonResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.conf import settings
+from django.db import IntegrityError
 from django.utils.encoding import force_str
-from django.utils.http import urlsafe_base64_decode
+from django.utils.http import urlencode, urlsafe_base64_decode
 from reportlab.pdfgen import canvas
 
-from .models import Comment, CustomUser, EmailLog, EmailVerification, Problem, Solution, Vote
+from .models import Comment, CustomUser, EmailLog, EmailVerification, Problem, Solution
 from .services import (
-    build_reports_context,
+    cast_vote,
     continue_problem_thread,
     create_account,
     create_human_solution,
-    create_problem_with_ai_response,
+    create_problem,
+    generate_problem_ai_response,
     get_problem_detail_context,
+    get_reports_context,
+    is_ai_reply_pending,
     list_problem_topics,
     list_recent_problems,
     send_password_reset_email,
     send_verification_email,
+    stream_problem_thread,
 )
+from .tasks import generate_initial_ai_reply
 
 logger = logging.getLogger(__name__)
 
+HOME_PAGE_SIZE = 25
+
+
+def login_required_json(view_func):
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        if not request.user.is_authenticated:
+            return JsonResponse({"error": "Authentication required."}, status=401)
+        return view_func(request, *args, **kwargs)
+
+    return wrapper
+
 
 def signup(request):
     if request.method == "POST":
@@ -46,12 +67,11 @@ def signup(request):
         if not username or not email:
             messages.error(request, "Username and email are required.")
             return redirect("signup")
-        if CustomUser.objects.filter(email__iexact=email).exists():
-            messages.error(request, "Email already exists.")
-            return redirect("signup")
-
         try:
             user, email_sent = create_account(username=username, email=email, password=password)
+        except IntegrityError:
+            messages.error(request, "An account with that email or username already exists.")
+            return redirect("signup")
         except Exception:
             logger.exception("Account creation failed")
             messages.error(request, "We could not create your account right now.")
@@ -185,7 +205,12 @@ def submit_problem(request):
         messages.error(request, "Problem description cannot be empty.")
         return redirect("home")
 
-    problem = create_problem_with_ai_response(user=request.user, description=description)
+    problem = create_problem(user=request.user, description=description)
+    try:
+        generate_initial_ai_reply.delay(problem.id)
+    except Exception:
+        logger.exception("Could not queue AI reply for problem %s; generating inline", problem.id)
+        generate_problem_ai_response(problem=problem)
     return redirect("problem_detail", problem_id=problem.id)
 
 
@@ -208,6 +233,34 @@ def add_ai_message(request, problem_id):
     return redirect("problem_detail", problem_id=problem.id)
 
 
+async def _sse_events(chunks):
+    async for text in chunks:
+        yield f"data: {json.dumps({'text': text})}\n\n"
+    yield "event: done\ndata: {}\n\n"
+
+
+@login_required_json
+def stream_ai_message(request, problem_id):
+    if request.method != "POST":
+        return JsonResponse({"error": "Use POST to continue the AI conversation."}, status=405)
+
+    problem = get_object_or_404(Problem.objects.select_related("user", "thread"), id=problem_id)
+    if problem.user != request.user:
+        return JsonResponse({"error": "Only the problem owner can continue the AI conversation."}, status=403)
+
+    content = request.POST.get("content", "").strip()
+    if not content:
+        return JsonResponse({"error": "Follow-up message cannot be empty."}, status=400)
+
+    response = StreamingHttpResponse(
+        _sse_events(stream_problem_thread(problem=problem, user=request.user, content=content)),
+        content_type="text/event-stream",
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
 @login_required(login_url="login")
 def add_human_solution(request, problem_id):
     if request.method != "POST":
@@ -254,6 +307,12 @@ def problem_detail(request, problem_id):
     return render(request, "problem_detail.html", context)
 
 
+def ai_reply_status(request, problem_id):
+    if not Problem.objects.filter(id=problem_id).exists():
+        return JsonResponse({"error": "Problem not found."}, status=404)
+    return JsonResponse({"pending": is_ai_reply_pending(problem_id)})
+
+
 @login_required(login_url="login")
 def accept_solution(request, solution_id):
     solution = get_object_or_404(Solution.objects.select_related("problem", "author"), id=solution_id)
@@ -300,9 +359,13 @@ def home(request):
     status = request.GET.get("status", "all").strip().lower()
     topic = request.GET.get("topic", "all").strip()
     problems = list_recent_problems(query=query or None, status=status or None, topic=topic or None)
+    page_obj = Paginator(problems, HOME_PAGE_SIZE).get_page(request.GET.get("page"))
+    filters = {"q": query, "status": status, "topic": topic}
     context = {
-        "problems": problems,
-        "filters": {"q": query, "status": status, "topic": topic},
+        "problems": page_obj,
+        "page_obj": page_obj,
+        "filters": filters,
+        "filter_query": urlencode({key: value for key, value in filters.items() if value}),
         "topics": list_problem_topics(),
     }
     return render(request, "index.html", context)
@@ -349,39 +412,33 @@ def profile(request):
 
 @login_required(login_url="login")
 def add_comment(request, solution_id):
-    solution = get_object_or_404(Solution, id=solution_id)
+    problem_id = Solution.objects.filter(id=solution_id).values_list("problem_id", flat=True).first()
+    if problem_id is None:
+        raise Http404("Solution not found")
     if request.method == "POST":
         content = request.POST.get("content", "").strip()
         if content:
-            Comment.objects.create(solution=solution, content=content, author=request.user)
-    return redirect("problem_detail", problem_id=solution.problem.id)
+            Comment.objects.create(solution_id=solution_id, content=content, author=request.user)
+    return redirect("problem_detail", problem_id=problem_id)
 
 
-@login_required(login_url="login")
+@login_required_json
 def vote_solution(request, solution_id, vote_type):
-    solution = get_object_or_404(Solution, id=solution_id)
-    vote, created = Vote.objects.get_or_create(user=request.user, solution=solution)
-    if not created and vote.type == vote_type:
-        vote.delete()
-        message = "Vote removed"
-    else:
-        vote.type = vote_type
-        vote.save()
-        message = "Vote recorded"
-    return JsonResponse(
-        {
-            "message": message,
-            "upvotes": Vote.objects.filter(solution=solution, type="up").count(),
-            "downvotes": Vote.objects.filter(solution=solution, type="down").count(),
-        }
-    )
+    if vote_type not in {"up", "down"}:
+        return JsonResponse({"error": "Invalid vote type."}, status=400)
+
+    try:
+        message, counts = cast_vote(user=request.user, solution_id=solution_id, vote_type=vote_type)
+    except Solution.DoesNotExist as exc:
+        raise Http404("Solution not found") from exc
+    return JsonResponse({"message": message, **counts})
 
 
 @staff_member_required(login_url="login")
 def reports_dashboard(request):
     if not request.user.has_perm("main.view_reports_dashboard"):
         raise PermissionDenied("You do not have permission to view reports.")
-    context = build_reports_context()
+    context = get_reports_context()
     if request.GET.get("export") == "csv":
         response = HttpResponse(content_type="text/csv")
         response["Content-Disposition"] = 'attachment; filename="reports.csv"'